@@ -1,7 +1,7 @@
-from .format import SFormat
+from .format import SFormat, batch_detect
 from .silver import Silver
 
 from .audio.wave.chunky import Chunky
 from .audio.wave.wave import SWave
 
-__all__ = ["Silver", "SFormat", "Chunky", "SWave"]
+__all__ = ["Silver", "SFormat", "Chunky", "SWave", "batch_detect"]
@@ -1,13 +1,40 @@
 # File: audio/wave/chunky.py
 
-from typing import Generator, Tuple
+import sys
+
+from typing import Generator, Iterator, Tuple
 
 FALSE_SIZE = "0xffffffff"  # -1 / "0xFFFFFFFF"
 NULL_IDENTIFIER = "\x00\x00\x00\x00"
 
-IGNORE_CHUNKS = ["data", "JUNK", "FLLR", "PAD "]
+IGNORE_CHUNKS = frozenset({"data", "JUNK", "FLLR", "PAD "})
+
+OPTIONAL_IGNORE_CHUNKS = frozenset(
+    {"minf", "elm1", "regn", "umid", "elmo", "DGDA", "ovwf"}
+)
+
+# Masters whose size field is valid, i.e. not an RF64 placeholder
+RIFF_MASTERS = frozenset({"RIFF", "RIFX", "FIRR", "BW64"})
+
+# Chunks the records of an `afsp` chunk are transferred to
+AFSP_TARGETS = frozenset({"DISP", "LIST"})
+
+LIST_IDENTIFIER = "LIST"
 
-OPTIONAL_IGNORE_CHUNKS = ["minf", "elm1", "regn", "umid", "elmo", "DGDA", "ovwf"]
+# Master chunk identifier -> byte order
+BYTEORDERS = {
+    "RIFF": "little",
+    "BW64": "little",
+    "RF64": "little",
+    "RIFX": "big",
+    "FIRR": "big",
+}
+
+# Known LIST types, keyed by their raw bytes to skip decoding
+LIST_TYPES = {
+    b"INFO": "INFO",
+    b"adtl": "adtl",
+}
 
 
 class Chunky:
@@ -32,18 +59,22 @@ class Chunky:
 
     def get_byteorder(self, master: str) -> str:
         """Determines the byte order based on the master chunk identifier."""
-        if master in ["RIFF", "BW64", "RF64"]:
-            return self.LITTLE_ENDIAN
-        elif master in ["RIFX", "FIRR"]:
-            return self.BIG_ENDIAN
-        else:
-            raise ValueError(f"Invalid master chunk identifier: {master}")
+        try:
+            return BYTEORDERS[master]
+        except KeyError:
+            raise ValueError(f"Invalid master chunk identifier: {master}") from None
 
     def get_chunks(
         self, stream, ignore: bool = False
-    ) -> Generator[Tuple[str, int, bytes], None, None]:
+    ) -> Iterator[Tuple[str, int, bytes]]:
         """
-        Retrieves and yields all chunks from a given RIFF-based WAV-like stream.
+        Retrieves all chunks from a given RIFF-based WAV-like stream.
+
+        The master header is read immediately, so `master`, `byteorder` and
+        `formtype` are set before the returned iterator yields its first chunk.
+
+        Each `LIST` chunk is followed by its list-type (e.g. `INFO`, `adtl`) as a
+        separate chunk, whose data holds the list's sub-chunks.
         """
 
         # Reset the stream
@@ -62,9 +93,9 @@ class Chunky:
 
         if master_size == FALSE_SIZE:
             # Size is set to -1, true size is stored in ds64
-            yield from self._rf64(stream, byteorder, ignore)
-        elif master in ["RIFF", "RIFX", "FIRR", "BW64"]:
-            yield from self._riff(stream, byteorder, ignore)
+            return self._rf64(stream, byteorder, ignore)
+        elif master in RIFF_MASTERS:
+            return self._riff(stream, byteorder, ignore)
         else:
             raise ValueError(f"Unknown or unsupported format: {master}")
 
@@ -80,7 +111,8 @@ class Chunky:
             if len(identifier_bytes) < 4:
                 break
 
-            chunk_identifier = identifier_bytes.decode(self.ENCODING)
+            # Interned so identifier comparisons downstream hit the identity fast path
+            chunk_identifier = sys.intern(identifier_bytes.decode(self.ENCODING))
             if chunk_identifier == "afsp":
                 # Records from the `afsp` chunk are transferred to DISP/LIST[INFO] chunks
                 # Thus, the `afsp` is ignored as it contains no size field
@@ -112,8 +144,11 @@ class Chunky:
 
             yield (chunk_identifier, chunk_size, chunk_data)
 
+            if chunk_identifier == LIST_IDENTIFIER:
+                yield self._list_type(chunk_size, chunk_data)
+
             # Skip to the start of the next chunk
-            stream.seek(chunk_size - len(chunk_data), 1)
+            self._skip(stream, chunk_size - len(chunk_data))
 
     def _rf64(
         self, stream, byteorder: str, ignore: bool
@@ -167,15 +202,15 @@ class Chunky:
         }
 
         # Skip to end of ds64 chunk
-        current_location = stream.tell()
-        stream.seek(current_location + table_entry_count * 12)
+        self._skip(stream, table_entry_count * 12)
 
         while True:
             identifier_bytes = stream.read(4)
             if len(identifier_bytes) < 4:
                 break
 
-            chunk_identifier = identifier_bytes.decode(self.ENCODING)
+            # Interned so identifier comparisons downstream hit the identity fast path
+            chunk_identifier = sys.intern(identifier_bytes.decode(self.ENCODING))
 
             if chunk_identifier == "afsp":
                 self._skip_afsp(stream)
@@ -213,8 +248,32 @@ class Chunky:
             if chunk_identifier != NULL_IDENTIFIER:
                 yield (chunk_identifier, chunk_size, chunk_data)
 
+                if chunk_identifier == LIST_IDENTIFIER:
+                    yield self._list_type(chunk_size, chunk_data)
+
             # Skip to the start of the next chunk
-            stream.seek(chunk_size - len(chunk_data), 1)
+            self._skip(stream, chunk_size - len(chunk_data))
+
+    def _list_type(self, size: int, data: bytes) -> Tuple[str, int, bytes]:
+        """
+        Splits a `LIST` chunk into its list-type identifier and sub-chunk data.
+        """
+        list_type = data[:4]
+        identifier = LIST_TYPES.get(list_type)
+        if identifier is None:
+            identifier = sys.intern(list_type.decode(self.ENCODING).strip())
+
+        return (identifier, size - 12, data[4:])
+
+    def _skip(self, stream, offset: int):
+        """
+        Seeks `offset` bytes forward, stopping at the end of the stream.
+        """
+        try:
+            stream.seek(offset, 1)
+        except ValueError:
+            # Unlike files, mmap refuses to seek past its end (truncated or unpadded files)
+            stream.seek(0, 2)
 
     def _skip_afsp(self, stream):
         """
@@ -227,7 +286,7 @@ class Chunky:
 
             next_chunk_identifier = next_identifier_bytes.decode(self.ENCODING)
 
-            if next_chunk_identifier in ["DISP", "LIST"]:
+            if next_chunk_identifier in AFSP_TARGETS:
                 # If we find DISP or LIST, seek back to the start of this chunk
                 stream.seek(-4, 1)
                 break
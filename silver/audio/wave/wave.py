@@ -1,13 +1,13 @@
 # File: audio/wave/wave.py
 
-import io
+import array
 import json
 import struct
-import uuid
+import sys
 import xml.etree.ElementTree as ET
 
-from dataclasses import dataclass
-from typing import Dict, Generator, List, Optional, Tuple, Union
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Generator, List, NamedTuple, Optional, Tuple, Union
 
 from ._storage import CODECS, GENERIC_CHANNEL_MASK_MAP
 from .chunky import Chunky
@@ -26,6 +26,8 @@ PVOC_EX = [
 
 # Special format identifiers
 EXTENSIBLE = 65534
+PCM = 1
+IEEE_FLOAT = 3
 CODING_HISTORY_LO = 602
 
 # Wave formats
@@ -53,6 +55,99 @@ CF_TYPES = {
     CF_PALETTE: "CF_PALETTE",
 }
 
+# array.array type codes for sample layouts -- (audio_format, bits_per_sample)
+SAMPLE_TYPECODES = {
+    (PCM, 8): "B",  # 8-bit PCM is unsigned
+    (PCM, 16): "h",
+    (PCM, 32): "i",
+    (IEEE_FLOAT, 32): "f",
+    (IEEE_FLOAT, 64): "d",
+}
+
+
+# Every speaker position bit defined in GENERIC_CHANNEL_MASK_MAP
+CHANNEL_MASK_BITS = sum(GENERIC_CHANNEL_MASK_MAP)
+
+
+def _structs(pattern: str) -> Dict[str, struct.Struct]:
+    """Precompiles a struct pattern for both byte orders."""
+    return {
+        "little": struct.Struct(f"<{pattern}"),
+        "big": struct.Struct(f">{pattern}"),
+    }
+
+
+def _as_dict(chunk) -> Dict[str, Any]:
+    """Returns a shallow field-to-value mapping of a decoded chunk dataclass."""
+    if hasattr(chunk, "to_dict"):
+        return chunk.to_dict()
+
+    return {field.name: getattr(chunk, field.name) for field in fields(chunk)}
+
+
+def _ascii_property(field_name: str) -> property:
+    """Returns a read-only property decoding the raw bytes field `field_name`."""
+    return property(
+        lambda chunk: sanitize_fallback(getattr(chunk, field_name), "ascii")
+    )
+
+
+def _json_default(value: Any) -> Any:
+    """Encodes nested chunk records (e.g. SampleLoop) that json cannot serialize."""
+    if hasattr(value, "__dataclass_fields__"):
+        return _as_dict(value)
+
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="ignore")
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Precompiled chunk patterns, keyed by byte order
+FMT_STRUCT = _structs("HHIIHH")
+FMT_EXTENSIBLE_STRUCT = _structs("HHI")
+PVOC_EX_STRUCT = _structs("II")
+PVOC_EX_DATA_STRUCT = _structs("HHHHIIIIff")
+INST_STRUCT = _structs("BBBBBBB")
+SMPL_STRUCT = _structs("iiiiiiiii")
+SMPL_LOOP_STRUCT = _structs("IIIIII")
+ACID_STRUCT = _structs("IHHfIHHf")
+CHNA_STRUCT = _structs("HH")
+CHNA_TRACK_STRUCT = _structs("H12s14s11sc")
+INFO_TAG_STRUCT = _structs("4sI")
+STRC_STRUCT = _structs("IIIIIII")
+STRC_SLICE_STRUCT = _structs("IIQQII")
+CUE_POINT_STRUCT = _structs("IIIIII")
+
+# The fixed 421-byte bext prefix; BWF fields are always little-endian
+BEXT_STRUCT = struct.Struct("<256s32s32s10s8sIIH63s5H")
+
+# INFO tag identifiers mapped to the WaveInfoChunk attribute(s) they populate
+INFO_ATTRIBUTES = {
+    "IARL": ("archival_location",),
+    "IART": ("artist",),
+    "ICMS": ("commissioned",),
+    "ICMT": ("comment",),
+    "ICOP": ("copyright",),
+    "ICRD": ("creation_date",),
+    "ICRP": ("cropped",),
+    "IDIM": ("dimensions",),
+    "IDPI": ("dots_per_inch",),
+    "IENG": ("engineer",),
+    "IGNR": ("genre",),
+    "IKEY": ("keywords",),
+    "ILGT": ("lightness",),
+    "IMED": ("medium",),
+    "INAM": ("title",),
+    "IPLT": ("palette",),
+    "IPRD": ("product", "album"),
+    "ISBJ": ("subject",),
+    "ISFT": ("software",),
+    "ISRC": ("source",),
+    "ISRF": ("source_form",),
+    "ITCH": ("technician",),
+}
+
 
 # Source: https://tech.ebu.ch/docs/tech/tech3285s3.pdf
 # TODO: fix the names for everything (e.g. position = audio_sample_frame_index?)
@@ -83,8 +178,11 @@ ADTL_IDENTIFIER = "adtl"
 CUE_IDENTIFIER = "cue "
 PMX_IDENTIFIER = "_PMX"
 
+# adtl sub-chunks holding a cue point ID followed by text
+LABEL_NOTE_IDENTIFIERS = frozenset({"labl", "note"})
 
-@dataclass
+
+@dataclass(slots=True)
 class GenericChunk:
     """A default chunk for unsupported or unknown chunks."""
 
@@ -93,7 +191,7 @@ class GenericChunk:
     data: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveFormatChunk:
     # General chunk info
     identifier: str
@@ -114,7 +212,7 @@ class WaveFormatChunk:
 
     # Extensible info
     valid_bits_per_sample: Optional[int] = None
-    channel_mask: Optional[str] = None
+    channel_mask_raw: Optional[int] = None
     speaker_layout: Optional[List[str]] = None
     subformat: Optional[
         Dict[str, Union[str, Dict[str, Optional[Union[int, float]]]]]
@@ -160,6 +258,25 @@ class WaveFormatChunk:
     analysis_rate: Optional[float] = None
     window_param: Optional[float] = None
 
+    @property
+    def channel_mask(self) -> Optional[str]:
+        """The channel mask as a 16-digit binary string."""
+        if self.channel_mask_raw is None:
+            return None
+
+        return format(self.channel_mask_raw, "016b")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the chunk's fields with the channel mask in its binary form."""
+        values = {}
+        for field in fields(self):
+            if field.name == "channel_mask_raw":
+                values["channel_mask"] = self.channel_mask
+            else:
+                values[field.name] = getattr(self, field.name)
+
+        return values
+
     @property
     def encoding(self) -> str:
         if self.audio_format != EXTENSIBLE:
@@ -171,22 +288,23 @@ class WaveFormatChunk:
         return self.mode
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveDataChunk:
     identifier: str
-    raw_data: bytes
+    raw_data: bytes  # Always empty: the payload is skipped, see SWave.samples()
     byte_count: int
     frame_count: int
+    offset: Optional[int] = None  # Stream position of the first sample
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveFactChunk:
     identifier: str
     size: int
     samples: int
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveInfoChunk:
     identifier: str
     size: int
@@ -218,7 +336,7 @@ class WaveInfoChunk:
     # fmt: on
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveInstrumentChunk:
     identifier: str
     size: int
@@ -234,7 +352,7 @@ class WaveInstrumentChunk:
     # fmt: on
 
 
-@dataclass
+@dataclass(slots=True)
 class WavePeakEnvelopeChunk:
     identifier: str
     size: int
@@ -254,7 +372,7 @@ class WavePeakEnvelopeChunk:
     peak_envelope_data: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class SampleLoop:
     identifier: str
     loop_type: int
@@ -264,7 +382,7 @@ class SampleLoop:
     loop_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveSampleChunk:
     identifier: str
     size: int
@@ -289,20 +407,12 @@ class WaveSampleChunk:
 #       The provided explanation MAY be incomplete and MAY not have been confirmed.
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveAcidChunk:
     identifier: str
     size: int
 
-    properties: str
-    # Based on the properties bitmask
-    is_oneshot: bool
-    is_loop: bool
-    is_root_note: bool
-    is_stretched: bool
-    is_disk_based: bool
-    is_ram_based: bool
-    is_unknown: bool
+    properties: int
 
     root_note: int
     unknown_one: int
@@ -315,8 +425,59 @@ class WaveAcidChunk:
 
     tempo: float
 
+    # Based on the properties bitmask
+    @property
+    def is_oneshot(self) -> bool:
+        return bool(self.properties & 0x01)
 
-@dataclass
+    @property
+    def is_loop(self) -> bool:
+        return not self.is_oneshot
+
+    @property
+    def is_root_note(self) -> bool:
+        return bool(self.properties & 0x02)
+
+    @property
+    def is_stretched(self) -> bool:
+        return bool(self.properties & 0x04)
+
+    @property
+    def is_disk_based(self) -> bool:
+        return bool(self.properties & 0x08)
+
+    @property
+    def is_ram_based(self) -> bool:
+        return not self.is_disk_based
+
+    @property
+    def is_unknown(self) -> bool:
+        return bool(self.properties & 0x10)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the chunk's fields with the property flags materialized."""
+        return {
+            "identifier": self.identifier,
+            "size": self.size,
+            "properties": self.properties,
+            "is_oneshot": self.is_oneshot,
+            "is_loop": self.is_loop,
+            "is_root_note": self.is_root_note,
+            "is_stretched": self.is_stretched,
+            "is_disk_based": self.is_disk_based,
+            "is_ram_based": self.is_ram_based,
+            "is_unknown": self.is_unknown,
+            "root_note": self.root_note,
+            "unknown_one": self.unknown_one,
+            "unknown_two": self.unknown_two,
+            "beat_count": self.beat_count,
+            "meter_denominator": self.meter_denominator,
+            "meter_numerator": self.meter_numerator,
+            "tempo": self.tempo,
+        }
+
+
+@dataclass(slots=True)
 class WaveCartChunk:
     identifier: str
     size: int
@@ -346,7 +507,7 @@ class WaveCartChunk:
             self.post_timers = []
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioID:
     track_index: int
     uid: str
@@ -355,7 +516,7 @@ class AudioID:
     padded: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveChnaChunk:
     identifier: str
     size: int
@@ -372,8 +533,7 @@ class WaveChnaChunk:
 # No testing will be created for this chunk.
 
 
-@dataclass
-class SliceBlock:
+class SliceBlock(NamedTuple):
     data1: int
     data2: int
     sample_position: int
@@ -382,7 +542,7 @@ class SliceBlock:
     data4: int
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveStrcChunk:
     identifier: str
     size: int
@@ -398,31 +558,62 @@ class WaveStrcChunk:
     slice_blocks: List[SliceBlock]
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveBroadcastChunk:
     identifier: str
     size: int
 
+    # Text fields are kept as raw bytes and decoded on access
     # fmt: off
-    description: str                    # ASCII 256
-    originator: str                     # ASCII 32
-    originator_reference: str           # ASCII 32
-    origin_date: str                    # ASCII 10 --YYYY:MM:DD
-    origin_time: str                    # ASCII 8 --HH:MM:SS
+    description_raw: bytes              # ASCII 256
+    originator_raw: bytes               # ASCII 32
+    originator_reference_raw: bytes     # ASCII 32
+    origin_date_raw: bytes              # ASCII 10 --YYYY:MM:DD
+    origin_time_raw: bytes              # ASCII 8 --HH:MM:SS
     time_reference_low: int
     time_reference_high: int
     version: int                        # 2
-    smpte_umid: str                     # 63
+    smpte_umid_raw: bytes               # 63
     loudness_value: int                 # 2
     loudness_range: int                 # 2
     max_true_peak_level: int            # 2
     max_momentary_loudness: int         # 2
     max_short_term_loudness: int        # 2
-    coding_history: str
+    coding_history_raw: bytes
     # fmt: on
 
+    description = _ascii_property("description_raw")
+    originator = _ascii_property("originator_raw")
+    originator_reference = _ascii_property("originator_reference_raw")
+    origin_date = _ascii_property("origin_date_raw")
+    origin_time = _ascii_property("origin_time_raw")
+    smpte_umid = _ascii_property("smpte_umid_raw")
+    coding_history = _ascii_property("coding_history_raw")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the chunk's fields with the text fields decoded."""
+        return {
+            "identifier": self.identifier,
+            "size": self.size,
+            "description": self.description,
+            "originator": self.originator,
+            "originator_reference": self.originator_reference,
+            "origin_date": self.origin_date,
+            "origin_time": self.origin_time,
+            "time_reference_low": self.time_reference_low,
+            "time_reference_high": self.time_reference_high,
+            "version": self.version,
+            "smpte_umid": self.smpte_umid,
+            "loudness_value": self.loudness_value,
+            "loudness_range": self.loudness_range,
+            "max_true_peak_level": self.max_true_peak_level,
+            "max_momentary_loudness": self.max_momentary_loudness,
+            "max_short_term_loudness": self.max_short_term_loudness,
+            "coding_history": self.coding_history,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class WaveDisplayChunk:
     identifier: str
     size: int
@@ -430,7 +621,7 @@ class WaveDisplayChunk:
     data: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CuePoint:
     point_id: str
     position: int
@@ -440,7 +631,7 @@ class CuePoint:
     sample_start: int
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveCueChunk:
     identifier: str
     size: int
@@ -448,13 +639,13 @@ class WaveCueChunk:
     cue_points: List[CuePoint]
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelNote:
     cue_point_id: str
     data: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LabeledText:
     cue_point_id: str
     sample_length: int
@@ -466,7 +657,7 @@ class LabeledText:
     data: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveADTLChunk:
     identifier: str
     size: int
@@ -474,20 +665,52 @@ class WaveADTLChunk:
     ascii_data: Union[LabelNote, LabeledText]
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveXMLChunk:
     identifier: str
     size: int
     xml: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveMD5Chunk:
     identifier: str
     size: int
     checksum: int
 
 
+def _emit_sanity(chunk: Dict[str, Any]):
+    chunk["sanity"] = str(chunk["sanity"])
+
+
+def _emit_strc(chunk: Dict[str, Any]):
+    _emit_sanity(chunk)
+    chunk["slice_blocks"] = [block._asdict() for block in chunk["slice_blocks"]]
+
+
+def _emit_cue(chunk: Dict[str, Any]):
+    chunk["cue_points"] = [_as_dict(point) for point in chunk["cue_points"]]
+
+
+def _emit_adtl(chunk: Dict[str, Any]):
+    chunk["ascii_data"] = _as_dict(chunk["ascii_data"])
+
+
+def _emit_chna(chunk: Dict[str, Any]):
+    chunk["track_ids"] = [_as_dict(id) for id in chunk["track_ids"]]
+
+
+# Readable-output fixups for chunks holding errors or nested records
+EMITTERS = {
+    WaveFormatChunk: _emit_sanity,
+    WaveSampleChunk: _emit_sanity,
+    WaveStrcChunk: _emit_strc,
+    WaveCueChunk: _emit_cue,
+    WaveADTLChunk: _emit_adtl,
+    WaveChnaChunk: _emit_chna,
+}
+
+
 class SWave:
     """
     Reading and decoding of WAVE files.
@@ -561,11 +784,21 @@ class SWave:
         # self.r64m: Optional[WaveR64mChunk] = None           # R64m chunk.
         self.strc: Optional[WaveStrcChunk] = None           # Undocumented STRC chunk, related to ACID loops.
 
+        # -: Aux: stores a list of chunk identifiers, filled in by all_chunks
+        self.chunk_ids = []
+        self.decoded_attrs = []     # Attribute names set by _decode_chunk, in order.
+
+        # -: Dispatch: decoders keyed by lowercased, stripped chunk identifier
+        self._decoders = {
+            "_pmx": self._pmx, "acid": self._acid, "adtl": self._adtl, "axml": self._axml,
+            "bext": self._bext, "cart": self._cart, "chna": self._chna, "cue": self._cue,
+            "data": self._data, "disp": self._disp, "fact": self._fact, "fmt": self._fmt,
+            "info": self._info, "inst": self._inst, "ixml": self._ixml, "levl": self._levl,
+            "md5": self._md5, "pmx": self._pmx, "smpl": self._smpl, "strc": self._strc,
+        }
+
         # -: Initialize attributes
         self.all_chunks()
-
-        # -: Aux: stores a list of chunk identifiers
-        self.chunk_ids = list((id[0] for id in self.chunks))
         # fmt: on
 
     def all_chunks(self):
@@ -575,53 +808,60 @@ class SWave:
         chunky = Chunky()
         chunk_counts = {}
 
-        for identifier, size, data in chunky.get_chunks(self.stream, self.ignore):
-            # Set some values for the future
-            self.byteorder = chunky.byteorder
-            self.master = chunky.master
-            self.formtype = chunky.formtype
-            self.ds64 = chunky.ds64
+        chunks = chunky.get_chunks(self.stream, self.ignore)
+
+        # The header is parsed up front, so these are known before any chunk
+        self.byteorder = chunky.byteorder
+        self.master = chunky.master
+        self.formtype = chunky.formtype
+        self._sign = bo_symbol(self.byteorder)
+
+        for identifier, size, data in chunks:
             self.chunks.append((identifier, size, data))
+            self.chunk_ids.append(identifier)
 
-            if identifier == LIST_IDENTIFIER or identifier == ADTL_IDENTIFIER:
-                # Determine the list-type and overwrite
-                identifier = data[:4].decode(DEFAULT_ENCODING).strip()
-                size -= 12
-                data = data[4:]
+            # The list-type (INFO, adtl ...) follows as its own chunk
+            if identifier == LIST_IDENTIFIER:
+                continue
 
-                self.chunks.append((identifier, size, data))
+            self._decode_chunk(identifier, size, data, chunk_counts)
 
-            false_identifier = identifier.lower().strip()
+        if self.fmt is not None and self.data is not None:
+            self.data.frame_count = self.data.byte_count // self.fmt.block_align
 
-            if not false_identifier == "_pmx":
-                _set = f"_{false_identifier}"
-            else:
-                _set = false_identifier
+        # Only known once the RF64 `ds64` chunk has been read
+        self.ds64 = chunky.ds64
 
-            if false_identifier not in chunk_counts:
-                chunk_counts[false_identifier] = 1
-            else:
-                chunk_counts[false_identifier] += 1
+    def _decode_chunk(
+        self, identifier: str, size: int, data: bytes, chunk_counts: Dict[str, int]
+    ):
+        """
+        Decodes a single chunk and sets it as an attribute, numbering repeated chunks.
+        """
+        false_identifier = identifier.lower().strip()
 
-            # Account for multiple chunks (e.g. more than 1 'fmt ')
-            attr_name = (
-                false_identifier
-                if chunk_counts[false_identifier] == 1
-                else f"{false_identifier}{chunk_counts[false_identifier]}"
-            )
+        if false_identifier not in chunk_counts:
+            chunk_counts[false_identifier] = 1
+        else:
+            chunk_counts[false_identifier] += 1
 
-            if hasattr(self, _set):
-                decoder = getattr(self, _set)
-                if callable(decoder):
-                    if _set == "_pmx":
-                        attr_name = "pmx"
-                    setattr(self, attr_name, decoder(identifier, size, data))
-            else:
-                gc = GenericChunk(identifier, size, str(data))
-                setattr(self, attr_name, gc)
+        # Account for multiple chunks (e.g. more than 1 'fmt ')
+        attr_name = (
+            false_identifier
+            if chunk_counts[false_identifier] == 1
+            else f"{false_identifier}{chunk_counts[false_identifier]}"
+        )
 
-            if self.fmt is not None and self.data is not None:
-                self.data.frame_count = int(self.data.byte_count / self.fmt.block_align)
+        decoder = self._decoders.get(false_identifier)
+        if decoder is not None:
+            if false_identifier in ("_pmx", "pmx"):
+                attr_name = "pmx"
+            setattr(self, attr_name, decoder(identifier, size, data))
+            self.decoded_attrs.append(attr_name)
+        else:
+            gc = GenericChunk(identifier, size, str(data))
+            setattr(self, attr_name, gc)
+            self.decoded_attrs.append(attr_name)
 
     def as_readable(self):
         """
@@ -629,17 +869,11 @@ class SWave:
 
         """
         base = {}
-        chunk_counts = {}
         # fmt: off
+        # Ordered as declared in __init__, followed by any other decoded chunks
         CHUNK_ATTR = [
-            "_pmx", "acid", "adtl", "axml", "bext", "cart", "chna", "cue", "data", "disp", "ds64", "fact", 
-            "fmt", "info", "inst", "ixml", "levl", "md5", "smpl", "strc",
-        ]
-
-        IGNORE_ATTR = [
-            "__annotations__", "__class__", "__dict__", "__doc__",
-            "__init__", "__module__", "__weakref__", "chunks", "stream", "purge", "to_json", "indent",
-            "truncate", "limit"
+            "acid", "adtl", "axml", "bext", "cart", "chna", "cue", "data", "dbmd", "disp",
+            "fact", "fmt", "info", "inst", "ixml", "levl", "md5", "pmx", "smpl", "strc",
         ]
 
         # Sorted based on importance rather than alphabetically
@@ -649,34 +883,28 @@ class SWave:
         ]
         # fmt: on
 
-        for attr, value in self.__dict__.items():
-            if value is None or attr in IGNORE_ATTR:
-                continue
-
-            chunk_type = (
-                attr
-                if attr in NOT_CHUNK
-                else (attr[:4] if attr[:3] != "fmt" else "fmt")
-            )
+        attrs = NOT_CHUNK + CHUNK_ATTR + ["ds64"]
+        attrs += [attr for attr in self.decoded_attrs if attr not in attrs]
 
-            if chunk_type not in CHUNK_ATTR and chunk_type in IGNORE_ATTR:
+        for attr_name in attrs:
+            value = getattr(self, attr_name, None)
+            if value is None:
                 continue
 
-            chunk_counts[chunk_type] = chunk_counts.get(chunk_type, 0) + 1
-            attr_name = (
-                f"{chunk_type}{chunk_counts[chunk_type]}"
-                if chunk_counts[chunk_type] > 1
-                else chunk_type
-            )
-
-            if chunk_type == "data":
+            if attr_name in NOT_CHUNK:
+                base[attr_name] = value
+            elif attr_name.startswith("data"):
                 base[attr_name] = {
                     "byte_count": value.byte_count,
                     "frame_count": value.frame_count,
                 }
             else:
                 if hasattr(value, "__dataclass_fields__"):
-                    for field_name, field_value in value.__dict__.items():
+                    emit = EMITTERS.get(type(value))
+
+                    # Work on a copy so the decoded chunk itself is left untouched
+                    value = _as_dict(value)
+                    for field_name, field_value in value.items():
                         if isinstance(field_value, bytes):
                             field_value = (
                                 field_value.decode("utf-8", errors="ignore")
@@ -694,22 +922,10 @@ class SWave:
                         ):
                             field_value = field_value[: self.limit] + "..."
 
-                        value.__dict__[field_name] = field_value
-
-                if hasattr(value, "sanity"):
-                    value.sanity = str(value.sanity)
-
-                if hasattr(value, "slice_blocks"):
-                    value.slice_blocks = [vars(block) for block in value.slice_blocks]
-
-                if hasattr(value, "cue_points"):
-                    value.cue_points = [vars(point) for point in value.cue_points]
-
-                if hasattr(value, "ascii_data"):
-                    value.ascii_data = value.ascii_data.__dict__
+                        value[field_name] = field_value
 
-                if hasattr(value, "track_ids"):
-                    value.track_ids = [vars(id) for id in value.track_ids]
+                    if emit is not None:
+                        emit(value)
 
                 if isinstance(value, Union[Dict, list, int, str]):
                     base[attr_name] = value
@@ -718,26 +934,48 @@ class SWave:
 
         base = del_null(base) if self.purge else base
 
-        # Reorder so non-chunk keys are first
-        ordered_base = {}
-        for key in NOT_CHUNK:
-            if key in base:
-                ordered_base[key] = base[key]
-
-        for key in base:
-            if key not in ordered_base:
-                ordered_base[key] = base[key]
-
         if self.to_json:
-            return json.dumps(ordered_base, indent=self.indent)
+            return json.dumps(base, indent=self.indent, default=_json_default)
         else:
-            return ordered_base
+            return base
+
+    def samples(self) -> Optional[array.array]:
+        """
+        Reads the interleaved samples of the ['data' / DATA] chunk into an array.
+
+        Supports 8/16/32-bit integer PCM and 32/64-bit IEEE float data, converted to
+        the native byte order. Returns None if there is no data chunk or the sample
+        layout is unsupported (e.g. 24-bit PCM or compressed formats).
+        """
+        if self.fmt is None or self.data is None or self.data.offset is None:
+            return None
+
+        audio_format = self.fmt.audio_format
+        if audio_format == EXTENSIBLE and self.fmt.subformat:
+            audio_format = self.fmt.subformat.get("audio_format")
+
+        typecode = SAMPLE_TYPECODES.get((audio_format, self.fmt.bits_per_sample))
+        if typecode is None:
+            return None
+
+        samples = array.array(typecode)
+        if samples.itemsize * 8 != self.fmt.bits_per_sample:
+            return None
+
+        # Padded data chunks can hold a trailing partial sample
+        count = self.data.byte_count // samples.itemsize
+        self.stream.seek(self.data.offset)
+        samples.frombytes(self.stream.read(count * samples.itemsize))
+
+        if samples.itemsize > 1 and self.byteorder != sys.byteorder:
+            samples.byteswap()
+
+        return samples
 
     # -: Onwards, chunk decoders
     def _fmt(self, identifier: str, size: int, data: bytes) -> WaveFormatChunk:
         """Decoder for the ['fmt ' / FORMAT] chunk."""
-        sign = bo_symbol(self.byteorder)
-        default_pattern = f"{sign}HHIIHH"
+        byteorder = self.byteorder
         sanity = []
         (
             audio_format,
@@ -746,14 +984,14 @@ class SWave:
             byte_rate,
             block_align,
             bits_per_sample,
-        ) = struct.unpack(default_pattern, data[:16])
+        ) = FMT_STRUCT[byteorder].unpack_from(data)
 
         # Determine the format type based on audio_format.
         # Non-PCM data MUST have an extended portion.
 
         extension_size = None
         valid_bits_per_sample = None
-        channel_mask = None
+        channel_mask_raw = None
         speaker_layout = None
         subformat = None
 
@@ -782,35 +1020,35 @@ class SWave:
         elif audio_format == EXTENSIBLE:
             mode = WAVE_FORMAT_EXTENSIBLE
 
-            extension_size, valid_bits_per_sample, cmask = struct.unpack(
-                f"{sign}HHI", data[16:24]
-            )
+            extension_size, valid_bits_per_sample, cmask = FMT_EXTENSIBLE_STRUCT[
+                byteorder
+            ].unpack_from(data, 16)
 
-            sfmt = data[24:40]
-            channel_mask = f"{cmask:016b}"
+            sfmt = data[24:40].hex()
+            channel_mask_raw = cmask
 
-            speaker_layout = [
-                GENERIC_CHANNEL_MASK_MAP.get(bit, "Unknown")
-                for bit in GENERIC_CHANNEL_MASK_MAP
-                if cmask & bit
-            ]
+            # Walk only the set bits, lowest first; undefined bits are skipped
+            speaker_layout = []
+            remaining = cmask & CHANNEL_MASK_BITS
+            while remaining:
+                bit = remaining & -remaining
+                speaker_layout.append(GENERIC_CHANNEL_MASK_MAP[bit])
+                remaining ^= bit
 
-            format_code = struct.unpack(f"{sign}H", sfmt[:2])[0]
+            format_code = int.from_bytes(data[24:26], byteorder)
 
             # TODO: is this correct for PVOC-EX?
-            guid = uuid.UUID(bytes=sfmt[:16])
-            subformat = {"audio_format": format_code, "guid": str(guid)}
+            # Canonical dashed form of the GUID bytes, in stored order
+            guid = f"{sfmt[:8]}-{sfmt[8:12]}-{sfmt[12:16]}-{sfmt[16:20]}-{sfmt[20:32]}"
+            subformat = {"audio_format": format_code, "guid": guid}
 
-            if str(guid) in PVOC_EX:
+            if guid in PVOC_EX:
                 if size != 80:
                     location = f"{FORMAT_CHUNK_LOCATION} -- PVOC-EX SIZE"
                     error_message = f"PVOC-EX FORMAT MUST ADHERE BE SIZE 80 NOT {size}."
                 else:
                     mode = WAVE_FORMAT_PVOC_EX
-                    (
-                        version,
-                        pvoc_size,
-                    ) = struct.unpack(f"{sign}II", data[40:48])
+                    version, pvoc_size = PVOC_EX_STRUCT[byteorder].unpack_from(data, 40)
 
                     index = 48
                     (
@@ -824,9 +1062,7 @@ class SWave:
                         frame_align,
                         analysis_rate,
                         window_param,
-                    ) = struct.unpack(
-                        f"{sign}HHHHIIIIff", data[index : index + pvoc_size]
-                    )
+                    ) = PVOC_EX_DATA_STRUCT[byteorder].unpack_from(data, index)
 
             else:
                 if size != 40:
@@ -837,7 +1073,7 @@ class SWave:
         elif size == 18:
             mode = WAVE_FORMAT_EXTENDED
 
-            extension_size = struct.unpack(f"{sign}H", data[16:18])[0]
+            extension_size = int.from_bytes(data[16:18], byteorder)
 
         else:
             if size != 16:
@@ -867,7 +1103,7 @@ class SWave:
             bits_per_sample=bits_per_sample,
             extension_size=extension_size,
             valid_bits_per_sample=valid_bits_per_sample,
-            channel_mask=channel_mask,
+            channel_mask_raw=channel_mask_raw,
             speaker_layout=speaker_layout,
             subformat=subformat,
             version=version,
@@ -886,15 +1122,19 @@ class SWave:
 
     def _data(self, identifier: str, size: int, raw_data: bytes) -> WaveDataChunk:
         """Decoder for the ['data' / DATA] chunk."""
+        # Chunky skips the sample data, leaving the stream at its start
         return WaveDataChunk(
-            identifier=identifier, raw_data=raw_data, byte_count=size, frame_count=None
+            identifier=identifier,
+            raw_data=raw_data,
+            byte_count=size,
+            frame_count=None,
+            offset=self.stream.tell(),
         )
 
     def _fact(self, identifier: str, size: int, data: bytes) -> WaveFactChunk:
         """Decoder for the ['fact' / FACT] chunk."""
-        sign = bo_symbol(self.byteorder)
-        samples = struct.unpack(f"{sign}I", data[:4])
-        return WaveFactChunk(identifier=identifier, size=size, samples=samples[0])
+        samples = int.from_bytes(data[:4], self.byteorder)
+        return WaveFactChunk(identifier=identifier, size=size, samples=samples)
 
     def _info(self, identifier: str, size: int, data: bytes) -> WaveInfoChunk:
         """Decoder for the ['INFO' / INFO] chunk."""
@@ -912,83 +1152,34 @@ class SWave:
             #   ...
             # fmt: on
 
-            stream = io.BytesIO(data)
-            while True:
-                id_bytes = stream.read(4)
-                if len(id_bytes) < 4:
-                    break
+            tag_struct = INFO_TAG_STRUCT[self.byteorder]
+            view = memoryview(data)
+            length = len(view)
+            position = 0
+            while position + tag_struct.size <= length:
+                id_bytes, tag_size = tag_struct.unpack_from(view, position)
+                position += tag_struct.size
 
                 tag_identifier = sanitize_fallback(id_bytes, "ascii")
-                size_bytes = stream.read(4)
-                if len(size_bytes) < 4:
-                    break
-
-                tag_size = int.from_bytes(size_bytes, self.byteorder)
                 # Account for padding or null bytes if chunk_size is odd
                 if tag_size % 2 != 0:
                     tag_size += 1
 
-                data_bytes = stream.read(tag_size)
-                tag_data = sanitize_fallback(data_bytes, "ascii")
-                if not tag_data:
-                    tag_data = sanitize_fallback(data_bytes, DEFAULT_ENCODING)
+                data_bytes = bytes(view[position : position + tag_size])
+                position += tag_size
+                # Latin-1 decodes ASCII identically and never fails
+                tag_data = sanitize_fallback(data_bytes, DEFAULT_ENCODING)
 
                 yield (tag_identifier, tag_size, tag_data)
 
         for tag_identifier, _, tag_data in yield_info():
-            match tag_identifier:
-                case "IARL":
-                    self.info.archival_location = tag_data
-                case "IART":
-                    self.info.artist = tag_data
-                case "ICMS":
-                    self.info.commissioned = tag_data
-                case "ICMT":
-                    self.info.comment = tag_data
-                case "ICOP":
-                    self.info.copyright = tag_data
-                case "ICRD":
-                    self.info.creation_date = tag_data
-                case "ICRP":
-                    self.info.cropped = tag_data
-                case "IDIM":
-                    self.info.dimensions = tag_data
-                case "IDPI":
-                    self.info.dots_per_inch = tag_data
-                case "IENG":
-                    self.info.engineer = tag_data
-                case "IGNR":
-                    self.info.genre = tag_data
-                case "IKEY":
-                    self.info.keywords = tag_data
-                case "ILGT":
-                    self.info.lightness = tag_data
-                case "IMED":
-                    self.info.medium = tag_data
-                case "INAM":
-                    self.info.title = tag_data
-                case "IPLT":
-                    self.info.palette = tag_data
-                case "IPRD":
-                    self.info.product = tag_data
-                    self.info.album = tag_data
-                case "ISBJ":
-                    self.info.subject = tag_data
-                case "ISFT":
-                    self.info.software = tag_data
-                case "ISRC":
-                    self.info.source = tag_data
-                case "ISRF":
-                    self.info.source_form = tag_data
-                case "ITCH":
-                    self.info.technician = tag_data
+            for attribute in INFO_ATTRIBUTES.get(tag_identifier, ()):
+                setattr(self.info, attribute, tag_data)
 
         return self.info
 
     def _inst(self, identifier: str, size: int, data: bytes) -> WaveInstrumentChunk:
         """Decoder for the ['inst' / INSTRUMENT] chunk."""
-        sign = bo_symbol(self.byteorder)
-        default_pattern = f"{sign}BBBBBBB"
         (
             unshifted_note,
             fine_tuning,
@@ -997,7 +1188,7 @@ class SWave:
             high_note,
             low_velocity,
             high_velocity,
-        ) = struct.unpack(default_pattern, data[:7])
+        ) = INST_STRUCT[self.byteorder].unpack_from(data)
 
         return WaveInstrumentChunk(
             identifier=identifier,
@@ -1051,8 +1242,6 @@ class SWave:
 
     def _smpl(self, identifier: str, size: int, data: bytes) -> WaveSampleChunk:
         """Decoder for the ['smpl' / SAMPLE] chunk."""
-        sign = bo_symbol(self.byteorder)
-        default_pattern = f"{sign}iiiiiiiii"
 
         (
             manufacturer,
@@ -1064,35 +1253,20 @@ class SWave:
             smpte_offset,
             sample_loop_count,
             sampler_data_size,
-        ) = struct.unpack(default_pattern, data[:36])
+        ) = SMPL_STRUCT[self.byteorder].unpack_from(data)
 
-        hours = (smpte_offset >> 24) & 0xFF
-        minutes = (smpte_offset >> 16) & 0xFF
-        seconds = (smpte_offset >> 8) & 0xFF
-        frames = smpte_offset & 0xFF
+        # One byte each, most significant first
+        hours, minutes, seconds, frames = smpte_offset.to_bytes(4, "big", signed=True)
         true_smpte_offset = (
             f"{hours:02}:{minutes:02}:{seconds:02}:{frames:02}/{smpte_format}"
         )
 
-        loop_pattern = f"{sign}IIIIII"
-        sample_loops = []
-        offset = 36
-        for _ in range(sample_loop_count):
-            (identifier, loop_type, start, end, fraction, loop_count) = struct.unpack(
-                loop_pattern, data[offset : offset + 24]
-            )
-
-            sample_loop = SampleLoop(
-                identifier=identifier,
-                loop_type=loop_type,
-                start=start,
-                end=end,
-                fraction=fraction,
-                loop_count=loop_count,
-            )
-
-            sample_loops.append(sample_loop)
-            offset += 24
+        # All loops are decoded in a single pass over the loop table
+        loop_struct = SMPL_LOOP_STRUCT[self.byteorder]
+        offset = 36 + loop_struct.size * sample_loop_count
+        sample_loops = [
+            SampleLoop(*loop) for loop in loop_struct.iter_unpack(data[36:offset])
+        ]
 
         sampler_data = (
             data[offset : offset + sampler_data_size] if sampler_data_size > 0 else None
@@ -1121,9 +1295,6 @@ class SWave:
 
     def _acid(self, identifier: str, size: int, data: bytes) -> WaveAcidChunk:
         """Decoder for the ['acid' / ACID/ACIDIZER] chunk."""
-        sign = bo_symbol(self.byteorder)
-
-        default_pattern = f"{sign}IHHfIHHf"
         (
             properties,
             root_note,
@@ -1133,25 +1304,12 @@ class SWave:
             meter_denominator,
             meter_numerator,
             tempo,
-        ) = struct.unpack(default_pattern, data[:24])
-
-        is_oneshot = (properties & 0x01) != 0
-        is_root_note = (properties & 0x02) != 0
-        is_stretched = (properties & 0x04) != 0
-        is_disk_based = (properties & 0x08) != 0
-        is_unknown = (properties & 0x10) != 0
+        ) = ACID_STRUCT[self.byteorder].unpack_from(data)
 
         return WaveAcidChunk(
             identifier=identifier,
             size=size,
             properties=properties,
-            is_oneshot=is_oneshot,
-            is_loop=not is_oneshot,  # inverse of is_oneshot
-            is_root_note=is_root_note,
-            is_stretched=is_stretched,
-            is_disk_based=is_disk_based,
-            is_ram_based=not is_disk_based,
-            is_unknown=is_unknown,
             root_note=root_note,
             unknown_one=unknown_one,
             unknown_two=unknown_two,
@@ -1164,7 +1322,7 @@ class SWave:
     def _cart(self, identifier: str, size: int, data: bytes) -> WaveCartChunk:
         """Decoder for the ['cart' / CART] chunk."""
         # Kinda messy, but it gets the job done
-        sign = bo_symbol(self.byteorder)
+        sign = self._sign
         default_pattern = f"{sign}4s64s64s64s64s64s64s64s10s8s10s8s64s64s64sI"
         unpacked_data = struct.unpack(
             default_pattern, data[: struct.calcsize(default_pattern)]
@@ -1175,7 +1333,7 @@ class SWave:
         post_timers = []
         for _ in range(8):
             timer_usage_id = (
-                data[offset : offset + 4].decode(DEFAULT_ENCODING).strip("\x00")
+                data[offset : offset + 4].strip(b"\x00").decode(DEFAULT_ENCODING)
             )
             offset += 4
             timer_value = int.from_bytes(data[offset : offset + 4], "little")
@@ -1229,9 +1387,7 @@ class SWave:
 
     def _chna(self, identifier: str, size: int, data: bytes) -> WaveChnaChunk:
         """Decoder for the ['chna' / CHNA] chunk."""
-        sign = bo_symbol(self.byteorder)
-        default_pattern = f"{sign}HH"
-        (track_count, uid_count) = struct.unpack(default_pattern, data[:4])
+        track_count, uid_count = CHNA_STRUCT[self.byteorder].unpack_from(data)
 
         # Source: https://adm.ebu.io/reference/excursions/chna_chunk.html
         # struct audioID
@@ -1242,30 +1398,24 @@ class SWave:
         #   CHAR    packRef[11];    // audioPackFormatID reference
         #   CHAR    pad;            // padding byte to ensure even number of bytes
         # }
-        track_pattern = f"{sign}H12s14s11sc"
-        track_ids = []
-        offset = 4
-
-        for _ in range(uid_count):
-            (track_index, uid, track_reference, pack_reference, pad) = struct.unpack(
-                track_pattern, data[offset : offset + 40]
-            )
-
-            uid = sanitize_fallback(uid, "ascii")
-            track_reference = sanitize_fallback(track_reference, "ascii")
-            pack_reference = sanitize_fallback(pack_reference, "ascii")
-            padded = pad == b"\x00"
-
-            audio_id = AudioID(
+        track_struct = CHNA_TRACK_STRUCT[self.byteorder]
+        end = 4 + track_struct.size * uid_count
+        track_ids = [
+            AudioID(
                 track_index=track_index,
-                uid=uid,
-                track_reference=track_reference,
-                pack_reference=pack_reference,
-                padded=padded,
+                uid=sanitize_fallback(uid, "ascii"),
+                track_reference=sanitize_fallback(track_reference, "ascii"),
+                pack_reference=sanitize_fallback(pack_reference, "ascii"),
+                padded=pad == b"\x00",
             )
-
-            track_ids.append(audio_id)
-            offset += 40
+            for (
+                track_index,
+                uid,
+                track_reference,
+                pack_reference,
+                pad,
+            ) in track_struct.iter_unpack(data[4:end])
+        ]
 
         return WaveChnaChunk(
             identifier=identifier,
@@ -1277,8 +1427,6 @@ class SWave:
 
     def _strc(self, identifier: str, size: int, data: bytes) -> WaveStrcChunk:
         """Decoder for the ['strc' / STRC] chunk."""
-        sign = bo_symbol(self.byteorder)
-        header_pattern = f"{sign}IIIIIII"
         sanity = []
         (
             unknown1,
@@ -1288,42 +1436,22 @@ class SWave:
             unknown4,
             unknown5,
             unknown6,
-        ) = struct.unpack(header_pattern, data[:28])
-
-        slice_pattern = f"{sign}IIQQII"
-        slice_blocks = []
-        offset = 28
-        total_data_size = len(data)
-
-        for i in range(slice_count):
-            if offset + 32 > total_data_size:
-                location = f"{STRC_CHUNK_LOCATION} -- SLICE {i}"
-                error_message = (
-                    "NOT ENOUGH DATA TO UNPACK SLICE -- MISSING OR PADDED SLICE."
-                )
-                sanity.append(PerverseError(location, error_message))
-                break
+        ) = STRC_STRUCT[self.byteorder].unpack_from(data)
+
+        # Only the slices that are fully present are decoded, in a single pass
+        slice_struct = STRC_SLICE_STRUCT[self.byteorder]
+        available = min(slice_count, (len(data) - 28) // slice_struct.size)
+        end = 28 + slice_struct.size * available
+        slice_blocks = list(
+            map(SliceBlock._make, slice_struct.iter_unpack(memoryview(data)[28:end]))
+        )
 
-            try:
-                (data1, data2, sample_position, sample_position2, data3, data4) = (
-                    struct.unpack(slice_pattern, data[offset : offset + 32])
-                )
-            except struct.error as e:
-                location = f"{STRC_CHUNK_LOCATION} -- SLICE {i}"
-                error_message = "SLICE {i} COULD NOT BE UNPACKED: {e}"
-                sanity.append(PerverseError(location, error_message))
-                break
-
-            slice_block = SliceBlock(
-                data1=data1,
-                data2=data2,
-                sample_position=sample_position,
-                sample_position2=sample_position2,
-                data3=data3,
-                data4=data4,
+        if available < slice_count:
+            location = f"{STRC_CHUNK_LOCATION} -- SLICE {available}"
+            error_message = (
+                "NOT ENOUGH DATA TO UNPACK SLICE -- MISSING OR PADDED SLICE."
             )
-            slice_blocks.append(slice_block)
-            offset += 32
+            sanity.append(PerverseError(location, error_message))
 
         if len(slice_blocks) != slice_count:
             location = f"{STRC_CHUNK_LOCATION} -- SLICE BLOCKS"
@@ -1346,59 +1474,48 @@ class SWave:
 
     def _bext(self, identifier: str, size: int, data: bytes) -> WaveBroadcastChunk:
         """Decoder for the ['bext' / BROADCAST] chunk."""
-        stream = io.BytesIO(data)
-
-        description, originator, originator_reference, origin_date, origin_time = (
-            struct.unpack("256s32s32s10s8s", stream.read(338))
-        )
-
-        description = sanitize_fallback(description, "ascii")
-        originator = sanitize_fallback(originator, "ascii")
-        originator_reference = sanitize_fallback(originator_reference, "ascii")
-        origin_date = sanitize_fallback(origin_date, "ascii")
-        origin_time = sanitize_fallback(origin_time, "ascii")
-
-        time_reference_low, time_reference_high, version = struct.unpack(
-            "IIH", stream.read(10)
-        )
-        smpte_umid = sanitize_fallback(
-            struct.unpack("63s", stream.read(63))[0], "ascii"
-        )
-
-        loudness_values = struct.unpack("5H", stream.read(10))
         (
+            description,
+            originator,
+            originator_reference,
+            origin_date,
+            origin_time,
+            time_reference_low,
+            time_reference_high,
+            version,
+            smpte_umid,
             loudness_value,
             loudness_range,
             max_true_peak_level,
             max_momentary_loudness,
             max_short_term_loudness,
-        ) = loudness_values
+        ) = BEXT_STRUCT.unpack_from(data)
 
-        coding_history = sanitize_fallback(data[CODING_HISTORY_LO:], "ascii")
+        coding_history = data[CODING_HISTORY_LO:]
 
         return WaveBroadcastChunk(
             identifier=identifier,
             size=size,
-            description=description,
-            originator=originator,
-            originator_reference=originator_reference,
-            origin_date=origin_date,
-            origin_time=origin_time,
+            description_raw=description,
+            originator_raw=originator,
+            originator_reference_raw=originator_reference,
+            origin_date_raw=origin_date,
+            origin_time_raw=origin_time,
             time_reference_low=time_reference_low,
             time_reference_high=time_reference_high,
             version=version,
-            smpte_umid=smpte_umid,
+            smpte_umid_raw=smpte_umid,
             loudness_value=loudness_value,
             loudness_range=loudness_range,
             max_true_peak_level=max_true_peak_level,
             max_momentary_loudness=max_momentary_loudness,
             max_short_term_loudness=max_short_term_loudness,
-            coding_history=coding_history,
+            coding_history_raw=coding_history,
         )
 
     def _disp(self, identifier: str, size: int, data: bytes) -> WaveDisplayChunk:
         """Decoder for the ['DISP' / DISPLAY] chunk."""
-        cftype_value = struct.unpack("I", data[:4])[0]
+        cftype_value = int.from_bytes(data[:4], "little")
         all_that_remains = sanitize_fallback(data[4:], DEFAULT_ENCODING)
         cftype = CF_TYPES.get(cftype_value, "UNKNOWN_TYPE")
 
@@ -1408,34 +1525,24 @@ class SWave:
 
     def _cue(self, identifier: str, size: int, data: bytes) -> WaveCueChunk:
         """Decoder for the ['cue ' / CUE] chunk."""
-        sign = bo_symbol(self.byteorder)
-        point_count = struct.unpack(f"{sign}I", data[:4])
-
-        cue_points = []
-        curr = 4
-
-        for cue in range(point_count[0]):
-            (point_id, position, chunk_id, chunk_start, block_start, sample_start) = (
-                struct.unpack(f"{sign}IIIIII", data[curr : curr + 24])
-            )
-
-            cue_point = CuePoint(
-                point_id, position, chunk_id, chunk_start, block_start, sample_start
-            )
+        point_count = int.from_bytes(data[:4], self.byteorder)
 
-            cue_points.append(cue_point)
-            curr += 24
+        point_struct = CUE_POINT_STRUCT[self.byteorder]
+        end = 4 + point_struct.size * point_count
+        cue_points = [
+            CuePoint(*point) for point in point_struct.iter_unpack(data[4:end])
+        ]
 
         return WaveCueChunk(
             identifier=identifier,
             size=size,
-            point_count=point_count[0],
+            point_count=point_count,
             cue_points=cue_points,
         )
 
     def _adtl(self, identifier: str, size: int, data: bytes) -> WaveADTLChunk:
         """Decoder for the ['adtl' / ASSOCIATED DATA] chunk."""
-        sign = bo_symbol(self.byteorder)
+        sign = self._sign
         if size < 8:
             return None
 
@@ -1443,8 +1550,8 @@ class SWave:
 
         sub_chunk_id = sanitize_fallback(sub_chunk_id, "ascii")
 
-        if sub_chunk_id in ["labl", "note"]:
-            (cue_point_id) = struct.unpack(f"{sign}I", data[8:12])
+        if sub_chunk_id in LABEL_NOTE_IDENTIFIERS:
+            cue_point_id = int.from_bytes(data[8:12], self.byteorder)
             sub_data = sanitize_fallback(data[16:], "ascii")
 
             return WaveADTLChunk(
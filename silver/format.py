@@ -1,12 +1,31 @@
 # File: format.py
 
+import io
 import json
+import os
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Union
 
-from .signatures import search_for, surface
+from .signatures import HEADER_SIZE, search_for, surface
 from .utils import Stream
 
+# Detection only reads a few header bytes per stream, so it is I/O-bound and the
+# GIL is released around each read()/seek(); oversubscribe the CPU count.
+MAX_DETECT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _map_concurrently(function: Callable, items: Iterable) -> List:
+    """Maps the function over the items on a detection thread pool, keeping their order."""
+    items = list(items)
+    if not items:
+        return []
+
+    workers = min(MAX_DETECT_WORKERS, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, items))
+
 
 class UnknownFormatError(Exception):
     """Unknown or unsupported format, or possibly an invalid stream."""
@@ -28,7 +47,7 @@ class SFormat:
         Parameters
         ----------
         stream : Stream
-            An io.BufferedReader or io.BytesIO stream.
+            A buffered binary stream (e.g. io.BufferedReader, io.BytesIO, gzip.GzipFile).
         check_format : str, optional
             A format to check for support, mainly set from the main Silver class to bypass auto-detection.
 
@@ -36,28 +55,50 @@ class SFormat:
         -------
         str
             The detected stream format.
+
+        Raises
+        ------
+        UnknownFormatError
+            If check_format is unsupported or no known format matches the stream.
         """
         if not isinstance(stream, Stream):
-            raise TypeError("Invalid stream-type: {type(stream)}")
-
-        if check_format is not None:
-            if search_for(check_format):
-                identity = surface(stream)
-                if identity is None:
-                    return self._deep()
-                else:
-                    return self.to(identity)
-            else:
-                return UnknownFormatError(f"{check_format} is not supported.")
-        else:
-            identity = surface(stream)
-            return self.to(identity)
+            raise TypeError(f"Invalid stream-type: {type(stream)}")
 
-        return None
+        if check_format is not None and not search_for(check_format):
+            raise UnknownFormatError(f"{check_format} is not supported.")
+
+        # Fall through to deep detection only when no signature matches
+        identity = surface(stream) or self._deep(stream)
+        if identity is None:
+            raise UnknownFormatError("Unknown or unsupported format.")
+
+        return self.to(identity)
+
+    def detect_many(
+        self, streams: Iterable[Stream], check_format: Optional[str] = None
+    ) -> List:
+        """
+        Detects the formats of multiple streams concurrently.
+
+        Parameters
+        ----------
+        streams : Iterable[Stream]
+            The io.BufferedReader or io.BytesIO streams to detect. Each stream must be distinct.
+        check_format : str, optional
+            A format to check for support, passed through to `detect`.
+
+        Returns
+        -------
+        list
+            The detection results, in the same order as the provided streams.
+        """
+        return _map_concurrently(
+            lambda stream: self.detect(stream, check_format), streams
+        )
 
     def _deep(self, stream: Stream):
         # We will see if this is needed as we go
-        return NotImplemented
+        return None
 
     def to(self, identity):
         """Converts the provided identity to the format set to True."""
@@ -66,3 +107,44 @@ class SFormat:
             return (identity, json.dumps(identity.__dict__, indent=self.indent))
         else:
             return (identity, identity)
+
+
+def batch_detect(
+    paths: Iterable[Union[str, Path]],
+    check_format: Optional[str] = None,
+    to_json: bool = False,
+    indent: int = 2,
+) -> List:
+    """
+    Detects the formats of multiple files concurrently.
+
+    Only the signature header of each file is read, with a single unbuffered read,
+    so scanning large libraries does not pull whole files into memory. Each file is
+    opened, read and detected on the same thread pool as `SFormat.detect_many`.
+
+    Parameters
+    ----------
+    paths : Iterable[Union[str, Path]]
+        The files to detect.
+    check_format : str, optional
+        A format to check for support, passed through to `SFormat.detect`.
+    to_json : bool
+        Whether each result also holds the identity as JSON, as in `SFormat`.
+    indent : int
+        The JSON indentation, only applicable if to_json is True.
+
+    Returns
+    -------
+    list
+        The detection results, in the same order as the provided paths.
+    """
+    sformat = SFormat(to_json, indent)
+
+    def detect_path(path: Union[str, Path]):
+        # Opened, read and detected on a worker thread, so the file reads overlap
+        with open(path, "rb", buffering=0) as file:
+            header = file.read(HEADER_SIZE)
+
+        return sformat.detect(io.BytesIO(header), check_format)
+
+    return _map_concurrently(detect_path, paths)
@@ -12,6 +12,17 @@ FILE = "file"
 HTTP = "http"
 HTTPS = "https"
 
+HTTP_SCHEMES = frozenset({HTTP, HTTPS})
+
+# Seconds to wait for the server to connect/respond
+REQUEST_TIMEOUT = 30
+
+# Bytes read from the response per iteration while downloading
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Shared across all fetches so connections to the same host are reused
+SESSION = requests.Session()
+
 
 class Protocol:
     """
@@ -26,21 +37,26 @@ class Protocol:
         """Converts a given URL to stream (io.BufferedReader or io.BytesIO)."""
         uri = urlparse(self.url)
 
-        if uri.scheme in [HTTP, HTTPS]:
+        if uri.scheme in HTTP_SCHEMES:
             return self._hs()
-        elif uri.scheme in [FILE]:
+        elif uri.scheme == FILE:
             return self._fs(uri)
         else:
             raise ValueError(f"Unsupported URI scheme: {uri.scheme}")
 
     def _hs(self):
         """HTTP/HTTPS to stream."""
-        response = requests.get(self.url, stream=True)
+        with SESSION.get(self.url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            if response.status_code != 200:
+                raise ValueError(f"Failed to retrieve the file from {self.url}")
 
-        if response.status_code != 200:
-            raise ValueError(f"Failed to retrieve the file from {self.uri}")
+            # Written as it arrives, rather than joining the whole body first
+            stream = io.BytesIO()
+            for block in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                stream.write(block)
 
-        return io.BytesIO(response.content)
+        stream.seek(0)
+        return stream
 
     def _fs(self, uri):
         """File URI to stream."""
@@ -63,20 +63,50 @@ def search_for(target: str) -> bool:
     return any(signature.identity.base == target for signature in SIGNATURES)
 
 
+# Number of leading bytes needed to check every signature
+HEADER_SIZE = max(
+    max(sig.offset + sig.size, sig.soffset + len(sig.identifier) - sig.size)
+    for sig in SIGNATURES
+)
+
+
+def header(stream: Stream, size: int = HEADER_SIZE) -> bytes:
+    """
+    Returns the first `size` bytes of the stream, leaving it positioned at the start.
+
+    Buffered streams are peeked rather than read, so nothing is consumed.
+    """
+    stream.seek(0)
+
+    peek = getattr(stream, "peek", None)
+    if peek is not None:
+        prefix = peek(size)
+        if len(prefix) >= size:
+            return prefix[:size]
+
+    prefix = stream.read(size)
+    stream.seek(0)
+
+    return prefix
+
+
 def surface(stream: Stream):
     """
     Surface detection based on supported file signatures.
     """
+    # A single header read serves every signature
+    prefix = header(stream)
+
     for signature in SIGNATURES:
-        stream.seek(signature.offset)
-        identifier = stream.read(signature.size)
+        start = signature.offset
+        identifier = prefix[start : start + signature.size]
 
         if identifier == signature.identifier[: signature.size]:
             # Determine if there's a sub-signature/form-type
             if len(signature.identifier) > signature.size:
                 remaining_bytes = signature.identifier[signature.size :]
-                stream.seek(signature.soffset)
-                sub_signature = stream.read(len(remaining_bytes))
+                start = signature.soffset
+                sub_signature = prefix[start : start + len(remaining_bytes)]
 
                 if remaining_bytes == sub_signature:
                     return signature.identity
@@ -1,25 +1,119 @@
 # File: silver.py
 
+import copy
+import fnmatch
 import io
+import mmap
+import os
 
 from pathlib import Path
+from typing import Generator, Optional, Union
 
-from .config import DEFAULT_CONFIG, InputSource
+from .config import DEFAULT_CONFIG, DEFAULT_CONFIG_OPTIONS, InputSource, OperationMode
 from .format import SFormat
 from .protocols import Protocol
 from .utils import Source
 
 from .audio.wave.wave import SWave
 
+# Read buffer for file sources that cannot be memory-mapped and for raw streams;
+# larger than io.DEFAULT_BUFFER_SIZE (8 KiB) so chunk walking needs fewer read syscalls
+BUFFER_SIZE = 128 * 1024
+
+# Input source values, bound once for the openers below
+_IS_FILE = InputSource.FILE.value
+_IS_URL = InputSource.URL.value
+_IS_STREAM = InputSource.STREAM.value
+_IS_BYTES = InputSource.BYTES.value
+
+_INPUT_SOURCES = {source.value: source for source in InputSource}
+
+OPERATION_MODES = frozenset(mode.value for mode in OperationMode)
+
+# String sources with one of these schemes are fetched through Protocol
+URL_SCHEMES = frozenset({"http", "https", "ftp", "file"})
+
+# Raised for sources that cannot be read as a binary stream
+SOURCE_TYPE_ERROR = "Source must be a file path, file-like object, or URL."
+
+
+def _open_str(source: str, buffer_size: int):
+    """Opens a URL or a file path string."""
+    scheme, separator, _ = source.partition("://")
+    if separator and scheme in URL_SCHEMES:
+        return source, Protocol(source).get_stream(), _IS_URL
+
+    return _open_path(Path(source), buffer_size)
+
+
+def _open_path(source: Path, buffer_size: int):
+    """Opens a file path, memory-mapping it when possible."""
+    # The builtin open skips Path.open's extra Python-level indirection
+    with open(source, "rb", buffering=0) as file:
+        try:
+            # Reads and seeks are served straight from the page cache
+            stream = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files and non-regular files (e.g. pipes) cannot be mapped
+            stream = None
+
+    if stream is None:
+        stream = open(source, "rb", buffering=buffer_size)
+
+    return source, stream, _IS_FILE
+
+
+def _open_stream(source: io.IOBase, buffer_size: int):
+    """Uses an already opened binary stream, buffering it if it is unbuffered."""
+    stream = source
+    if isinstance(stream, io.RawIOBase):
+        # Unbuffered streams would make every small header read hit the OS
+        stream = io.BufferedReader(stream, buffer_size=buffer_size)
+    elif not isinstance(stream, io.BufferedIOBase):
+        # Text streams and other IOBase objects are not a Stream SFormat can detect
+        raise TypeError(SOURCE_TYPE_ERROR)
+
+    return source, stream, _IS_STREAM
+
+
+def _open_bytes(source: bytes, buffer_size: int):
+    """Wraps raw bytes in a stream."""
+    # io.BytesIO shares the buffer of an immutable bytes object rather than copying
+    # it, and reads only copy the requested slice, so large sources stay cheap
+    return source, io.BytesIO(source), _IS_BYTES
+
+
+# Source type -> opener returning (source, stream, stype)
+# Exact types are looked up directly, subclasses fall back to isinstance
+_STREAM_OPENERS = {
+    str: _open_str,
+    Path: _open_path,
+    type(Path()): _open_path,
+    io.BufferedReader: _open_stream,
+    io.FileIO: _open_stream,
+    io.IOBase: _open_stream,
+    bytes: _open_bytes,
+}
+
 
 class Silver:
     """
     Main class of the [Silver] library.
 
-    Supports auto-detection of file formats, complete parsing and decoding, and accepts various input types, including files, directories, io.BufferedReader streams, raw bytes, and HTTP/HTTPS/File URIs.
+    Supports auto-detection of file formats, complete parsing and decoding, and accepts various input types, including files, directories, binary streams, raw bytes, and HTTP/HTTPS/File URIs.
+
+    Format detection and decoding are deferred until `format` or `wave` is first accessed, so the stream must still be open at that point.
+
+    Regular files are memory-mapped, so `buffer_size` has no effect on them. It only sets the read buffer for files that cannot be mapped (e.g. empty files or pipes) and for unbuffered raw streams, which are wrapped in io.BufferedReader.
     """
 
-    config = DEFAULT_CONFIG.copy()
+    # fmt: off
+    __slots__ = (
+        "source", "ignore", "purge", "to_json", "indent", "truncate", "limit",
+        "to_search", "buffer_size", "mode", "config", "stream", "stype", "source_type",
+        "_detected", "_wave",
+    )
+    # fmt: on
 
     def __init__(
         self,
@@ -31,6 +125,9 @@ class Silver:
         truncate: bool = False,
         limit: int = 2,
         check_format: str = None,
+        buffer_size: int = BUFFER_SIZE,
+        prefetch_format: bool = False,
+        mode: Optional[int] = None,
     ):
         """
         Initializes the Silver class with the given input source, operation mode, and output format.
@@ -46,75 +143,120 @@ class Silver:
         self.truncate = truncate
         self.limit = limit
         self.to_search = check_format
+        self.buffer_size = buffer_size
 
         # -: Internal
+        self.config = DEFAULT_CONFIG  # Shared until written, see _set_config
+
+        if mode is not None:
+            if mode not in OPERATION_MODES:
+                raise ValueError(
+                    f"Invalid operation mode: {mode}. Expected one of {sorted(OPERATION_MODES)}."
+                )
+
+            self.mode = mode
+            self._set_config("operation_mode", mode)
+        else:
+            self.mode = DEFAULT_CONFIG_OPTIONS["operation_mode"]
+
         self.stream = None
         self.stype = None
         self.source_type = None
-        self.format = None
-
-        # -: Details
-        self.wave = None
+        self._detected = None  # Set on first access to format or wave
+        self._wave = None
 
         # -: Do last
         self._initialize_stream()
 
+        if prefetch_format:
+            self.format
+
+    @classmethod
+    def from_directory(
+        cls,
+        root: Union[str, Path],
+        *,
+        pattern: str = "*",
+        eager: bool = False,
+        **kwargs,
+    ) -> Generator["Silver", None, None]:
+        """
+        Yields a Silver for every file in the directory whose name matches the pattern.
+
+        Entries are listed with os.scandir, whose cached entry types avoid a stat per file, and
+        each file is only opened once the generator reaches it. Formats are detected on first
+        access unless eager is True. Any other keyword arguments are passed to Silver.
+        """
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
+                    yield cls(Path(entry.path), prefetch_format=eager, **kwargs)
+
     def __enter__(self):
-        if isinstance(self.source, str):
-            if self.url:
-                self.stream = Protocol(self.source).get_stream()
-            else:
-                self.source = Path(self.source)
-                self.stream = self.source.open("rb")
-        elif isinstance(self.source, io.IOBase):
-            self.stream = self.source
-        elif isinstance(self.source, bytes):
-            self.stream = io.BytesIO(self.source)
+        # The stream is opened on construction, only re-open after __exit__
+        if self.stream is None or self.stream.closed:
+            self._initialize_stream()
+
+        return self
 
     def _initialize_stream(self):
         """Initializes the stream based on the source type."""
-        if isinstance(self.source, str) and self.source.startswith(
-            ("http://", "https://", "ftp://", "file://")
-        ):
-            proto = Protocol(self.source)
-            self.stream = proto.get_stream()
-            self.stype = InputSource.URL.value
-        elif isinstance(self.source, str):
-            self.source = Path(self.source)
-            self.stream = self.source.open("rb")
-            self.stype = InputSource.FILE.value
-        elif isinstance(self.source, Path):
-            self.stream = self.source.open("rb")
-            self.stype = InputSource.FILE.value
-        elif isinstance(self.source, (io.BufferedReader)):
-            self.stream = self.source
-            self.stype = InputSource.STREAM.value
-        elif isinstance(self.source, bytes):
-            self.stream = io.BytesIO(self.source)
-            self.stype = InputSource.BYTES.value
-        else:
-            raise TypeError("Source must be a file path, file-like object, or URL.")
-
-        sf = SFormat(self.to_json, self.indent)
-        identity, self.format = sf.detect(self.stream, self.to_search)
-
-        self.stype = self.stype
-        self.source_type = InputSource(self.stype)
-
-        match identity.base:
-            case "WAVE":
-                self.wave = SWave(
-                    self.stream,
-                    ignore=self.ignore,
-                    purge=self.purge,
-                    to_json=self.to_json,
-                    indent=self.indent,
-                    truncate=self.truncate,
-                    limit=self.limit,
-                )
+        opener = _STREAM_OPENERS.get(type(self.source))
+        if opener is None:
+            for source_type, candidate in _STREAM_OPENERS.items():
+                if isinstance(self.source, source_type):
+                    opener = candidate
+                    break
+            else:
+                raise TypeError(SOURCE_TYPE_ERROR)
+
+        self.source, self.stream, self.stype = opener(self.source, self.buffer_size)
+        self._wave = None  # Decoded against the previous stream, if any
+
+        self.source_type = _INPUT_SOURCES[self.stype]
 
         return self
 
+    def _set_config(self, option: str, value):
+        """Sets a config option, copying the shared default config on first write."""
+        if self.config is DEFAULT_CONFIG:
+            self.config = copy.deepcopy(DEFAULT_CONFIG)
+
+        self.config["config"][option] = value
+
+    def _detect(self):
+        """Detects the format of the stream once, on first use."""
+        if self._detected is None:
+            sf = SFormat(self.to_json, self.indent)
+            self._detected = sf.detect(self.stream, self.to_search)
+
+        return self._detected
+
+    @property
+    def format(self):
+        """The detected format of the source (a JSON string if to_json is set)."""
+        return self._detect()[1]
+
+    @property
+    def wave(self) -> Optional[SWave]:
+        """The decoded WAVE details, or None if the source is not a WAVE format."""
+        if self._wave is None:
+            identity, _ = self._detect()
+
+            match identity.base:
+                case "WAVE":
+                    self._wave = SWave(
+                        self.stream,
+                        ignore=self.ignore,
+                        purge=self.purge,
+                        to_json=self.to_json,
+                        indent=self.indent,
+                        truncate=self.truncate,
+                        limit=self.limit,
+                    )
+
+        return self._wave
+
     def __exit__(self, exc_type, exc_value, traceback):
         if self.stream and not self.stream.closed:
             self.stream.close()
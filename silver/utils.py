@@ -1,35 +1,48 @@
 # File: utils.py
 
 import io
+import mmap
 
 from pathlib import Path
 from typing import Dict, Union
 
-Source = Union[bytes, io.BufferedReader, Path, str]
-Stream = Union[io.BytesIO, io.BufferedReader]
+__all__ = [
+    "Source",
+    "Stream",
+    "bo_symbol",
+    "del_null",
+    "sanitize",
+    "sanitize_fallback",
+]
+
+# Struct byteorder symbols, keyed by byteorder name
+BO_SYMBOLS = {"big": ">", "little": "<"}
+
+Source = Union[bytes, io.IOBase, Path, str]
+Stream = Union[io.BytesIO, io.BufferedReader, io.BufferedIOBase, mmap.mmap]
 
 
 def bo_symbol(byteorder: str) -> str:
     """Returns the matching byteorder symbol for struct ('>' or '<')."""
-    match byteorder:
-        case "big":
-            return ">"
-        case "little":
-            return "<"
-        case _:
-            raise ValueError("Invalid byteorder. Use 'big' or 'little'.")
+    try:
+        return BO_SYMBOLS[byteorder]
+    except KeyError:
+        raise ValueError("Invalid byteorder. Use 'big' or 'little'.") from None
 
 
 def del_null(base: Dict) -> Dict:
     """
     Removes None, empty strings, and empty list values from a given dictionary.
     """
-    for key, value in list(base.items()):
-        if value is None or value == "" or value == []:
-            del base[key]
-        elif isinstance(value, dict):
-            del_null(value)
+    cleaned = {
+        key: del_null(value) if isinstance(value, dict) else value
+        for key, value in base.items()
+        if value is not None and value != "" and value != []
+    }
 
+    # Update in place, callers may hold a reference to the given dictionary
+    base.clear()
+    base.update(cleaned)
     return base
 
 
@@ -37,13 +50,7 @@ def sanitize(to_clean: bytes) -> bytes:
     """
     Sanitizes the provided bytes of all null bytes.
     """
-    return (
-        str(to_clean)
-        .rstrip("\x00")
-        .strip("\u0000")
-        .replace("\x00", "")
-        .replace("\\x00", "")
-    )
+    return to_clean.translate(None, b"\x00")
 
 
 def sanitize_fallback(to_decode: bytes, encoding: str) -> str:
@@ -52,12 +59,15 @@ def sanitize_fallback(to_decode: bytes, encoding: str) -> str:
 
     Rather than ignoring any errors, it returns an empty string.
     """
+    if not to_decode:
+        return ""
+
     try:
-        return (
-            to_decode.decode(encoding)
-            .rstrip("\x00")
-            .strip("\u0000")
-            .replace("\x00", "")
-        )
-    except (UnicodeDecodeError, AttributeError):
+        # Most tags carry no null bytes, skip the translate copy for those
+        if b"\x00" not in to_decode:
+            return to_decode.decode(encoding)
+
+        # Null bytes are dropped in a single pass over the raw bytes
+        return to_decode.translate(None, b"\x00").decode(encoding)
+    except (UnicodeDecodeError, AttributeError, TypeError):
         return ""
@@ -1,8 +1,11 @@
 # File: test_detection.py
 
+import builtins
 import gzip
+import io
+import threading
 
-from silver import Silver
+from silver import Silver, SFormat, batch_detect
 
 RIFF_WAVE = "samples/audio/wav/stereo-pcm-info-id3.wav"
 RIFX_WAVE = "samples/audio/wav/RIFX-16bit-mono.wav"
@@ -27,3 +30,32 @@ def test_rf64_detect():
         silver = Silver(content)
         f = silver.format
         assert f.base == "WAVE" and f.container == "RF64" and f.endian == "little"
+
+
+def test_detect_many():
+    riff = b"RIFF\x04\x00\x00\x00WAVE"
+    rifx = b"RIFX\x00\x00\x00\x04WAVE"
+    streams = [io.BytesIO(riff), io.BytesIO(rifx), io.BytesIO(riff)]
+
+    results = SFormat().detect_many(streams)
+    assert [identity.container for identity, _ in results] == ["RIFF", "RIFX", "RIFF"]
+
+
+def test_batch_detect(tmp_path, monkeypatch):
+    (tmp_path / "a.wav").write_bytes(b"RIFF\x04\x00\x00\x00WAVE")
+    (tmp_path / "b.wav").write_bytes(b"RIFX\x00\x00\x00\x04WAVE")
+
+    results = batch_detect([tmp_path / "a.wav", str(tmp_path / "b.wav")])
+    assert [identity.container for identity, _ in results] == ["RIFF", "RIFX"]
+
+    # Files are opened and read on the pool, not the calling thread
+    readers = []
+
+    def recording_open(*args, **kwargs):
+        readers.append(threading.current_thread())
+        return builtins.open(*args, **kwargs)
+
+    monkeypatch.setattr("silver.format.open", recording_open, raising=False)
+    batch_detect([tmp_path / "a.wav", tmp_path / "b.wav"])
+    assert len(readers) == 2
+    assert threading.main_thread() not in readers
@@ -1,5 +1,11 @@
 # File: test_inputs.py
 
+import gzip
+import io
+import tempfile
+
+import pytest
+
 from silver import Silver
 
 from pathlib import Path
@@ -36,6 +42,79 @@ def test_bytes_input():
     )
 
 
+def test_stream_input():
+    # Any binary stream is accepted, unbuffered ones are wrapped
+    silver = Silver(gzip.GzipFile(fileobj=io.BytesIO(gzip.compress(WAVE_RAW_BYTES))))
+    assert silver.format.base == "WAVE"
+
+    silver = Silver(io.BytesIO(WAVE_RAW_BYTES))
+    assert silver.format.base == "WAVE"
+
+    # Text streams and other non-buffered IOBase objects are rejected up front
+    with pytest.raises(TypeError):
+        Silver(io.StringIO("RIFF"))
+
+    with tempfile.SpooledTemporaryFile() as spooled:
+        spooled.write(WAVE_RAW_BYTES)
+        with pytest.raises(TypeError):
+            Silver(spooled)
+
+
+def test_directory_input(tmp_path):
+    for name in ("a.wav", "b.wav", "notes.txt"):
+        (tmp_path / name).write_bytes(WAVE_RAW_BYTES)
+    (tmp_path / "nested.wav").mkdir()
+
+    silvers = list(Silver.from_directory(tmp_path, pattern="*.wav"))
+    assert sorted(silver.source.name for silver in silvers) == ["a.wav", "b.wav"]
+    assert all(silver.format.base == "WAVE" for silver in silvers)
+    assert all(silver.wave.fmt.sample_rate == 44100 for silver in silvers)
+
+    for silver in silvers:
+        silver.stream.close()
+
+
+def test_context_manager():
+    silver = Silver(WAVE_RAW_BYTES)
+    stream = silver.stream
+
+    with silver as entered:
+        assert entered is silver and entered.stream is stream
+        assert entered.format.base == "WAVE"
+
+    assert stream.closed
+
+
+def test_context_manager_reenter(tmp_path):
+    path = tmp_path / "a.wav"
+    path.write_bytes(WAVE_RAW_BYTES + b"data\x04\x00\x00\x00\x01\x00\x02\x00")
+    silver = Silver(path)
+
+    with silver:
+        assert silver.wave.data.frame_count == 2
+
+    # Re-entering re-opens the file, the wave is decoded again from the new stream
+    with silver:
+        assert silver.wave.samples().tolist() == [1, 2]
+
+
+def test_imperfect_file_input(tmp_path):
+    fmt = WAVE_RAW_BYTES[12:]
+
+    # Data chunk shorter than declared
+    truncated = tmp_path / "truncated.wav"
+    truncated.write_bytes(
+        b"RIFF\x64\x00\x00\x00WAVE" + fmt + b"data\x40\x00\x00\x00\x01\x00"
+    )
+
+    # Odd-sized last chunk without its pad byte
+    unpadded = tmp_path / "unpadded.wav"
+    unpadded.write_bytes(b"RIFF\x64\x00\x00\x00WAVE" + fmt + b"MD5 \x03\x00\x00\x00abc")
+
+    assert Silver(truncated).wave.chunk_ids == ["fmt ", "data"]
+    assert Silver(unpadded).wave.chunk_ids == ["fmt ", "MD5 "]
+
+
 def test_https_input():
     silver = Silver(HTTPS_TEST_1)
     assert silver.format is not None and silver.format.base == "WAVE"
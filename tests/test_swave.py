@@ -2,6 +2,10 @@
 
 # Test every aspect/chunk zzz
 
+import io
+import json
+import struct
+
 from silver import Silver, SWave
 
 from dataclasses import fields
@@ -96,6 +100,54 @@ def test_chunk_ids():
     ]
 
 
+def test_samples():
+    # 16-bit stereo PCM, 2 frames
+    wave = (
+        b"RIFF\x2c\x00\x00\x00WAVE"
+        b"fmt \x10\x00\x00\x00\x01\x00\x02\x00\x80\xbb\x00\x00"
+        b"\x00\xee\x02\x00\x04\x00\x10\x00"
+        b"data\x08\x00\x00\x00\x01\x00\xfe\xff\x03\x00\xfc\xff"
+    )
+    sw = SWave(io.BytesIO(wave))
+
+    assert sw.data.frame_count == 2
+    assert sw.samples().tolist() == [1, -2, 3, -4]
+
+
+def test_readable_json():
+    # 16-bit mono PCM with a single smpl loop
+    fmt = struct.pack("<HHIIHH", 1, 1, 48000, 96000, 2, 16)
+    smpl = struct.pack("<9i", 0, 0, 20833, 60, 0, 0, 0, 1, 0)
+    smpl += struct.pack("<6I", 0, 0, 10, 20, 0, 0)
+    wave = b"RIFF" + struct.pack("<I", 96) + b"WAVE"
+    wave += b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    wave += b"smpl" + struct.pack("<I", len(smpl)) + smpl
+    sw = SWave(io.BytesIO(wave), to_json=True)
+
+    readable = json.loads(sw.as_readable())
+    assert readable["smpl"]["sample_loops"][0]["end"] == 20
+
+    # Emitting does not alter the decoded chunks
+    assert json.loads(sw.as_readable()) == readable
+    assert sw.smpl.sample_loops[0].end == 20
+
+
+def test_rf64_list_chunk():
+    # 16-bit mono PCM with an INFO list, sizes of data held in ds64
+    fmt = struct.pack("<HHIIHH", 1, 1, 48000, 96000, 2, 16)
+    info = b"INFO" + b"INAM" + struct.pack("<I", 6) + b"Title\x00"
+    ds64 = struct.pack("<7I", 0, 0, 4, 0, 0, 0, 0)
+    wave = b"RF64" + b"\xff\xff\xff\xff" + b"WAVE"
+    wave += b"ds64" + struct.pack("<I", len(ds64)) + ds64
+    wave += b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    wave += b"LIST" + struct.pack("<I", len(info)) + info
+    wave += b"data" + b"\xff\xff\xff\xff" + b"\x01\x00\x02\x00"
+    sw = SWave(io.BytesIO(wave))
+
+    assert sw.chunk_ids == ["fmt ", "LIST", "INFO", "data"]
+    assert sw.info.title == "Title"
+
+
 def test_xml_chunks():
     # iXML, _PMX, aXML ...
     s = Silver("samples/audio/wav/BWF-INFO-_PMX-aXML-iXML-bext-MD5.wav")